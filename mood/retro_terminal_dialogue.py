@@ -13,10 +13,12 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Apply the retro styling with VT323 font and green-on-black theme
-def apply_terminal_style():
-    # CSS for enhanced 80s retro terminal look
-    st.markdown("""
+# CSS for the 80s retro terminal look, built once at import so each
+# rerun only pays the markdown call, not the string construction.
+# It must still be emitted every rerun: Streamlit drops elements a
+# script run does not produce, so a session-state "injected once"
+# flag would lose the stylesheet on the first interaction.
+_TERMINAL_CSS = """
     <style>
     @import url('https://fonts.googleapis.com/css2?family=VT323&display=swap');
     
@@ -213,7 +215,11 @@ def apply_terminal_style():
         }
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+# Apply the retro styling with VT323 font and green-on-black theme
+def apply_terminal_style():
+    st.markdown(_TERMINAL_CSS, unsafe_allow_html=True)
 
 # Function to load dialogue data from JSON file
 def load_dialogue_data(file_path="dialogue_data.json"):
@@ -0,0 +1,7 @@
+"""
+Tool-Currency source package.
+
+Makes src importable as a regular package so `from src.currency_utils
+import ...` resolves without path manipulation whenever the repository
+root is already on sys.path (tests, bare imports).
+"""
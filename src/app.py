@@ -5,23 +5,98 @@ A retro-themed currency converter built with Streamlit, featuring a
 nostalgic 80s terminal interface and real-time currency conversion.
 """
 import streamlit as st
+from collections import deque
 from datetime import datetime
-import json
+from functools import lru_cache
+from html import escape
 import os
 import sys
-
-# Add the parent directory to sys.path to import from src
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import time
+import requests
+
+# Add the parent directory to sys.path to import from src, but only once:
+# streamlit re-executes this module on session start and unconditional
+# inserts would grow sys.path over the life of the process
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
 from src.currency_utils import (
     load_currencies,
-    get_currency_codes,
-    get_currency_name,
-    get_currency_symbol,
     get_exchange_rates,
     get_historical_rates,
-    convert_currency
+    convert_currency,
+    start_background_refresh,
+    _network_available
 )
-import plotly.graph_objects as go
+import numpy as np
+
+# Keep the USD rates snapshot warm so interactive paths never pay the
+# API round trip themselves (idempotent; one daemon thread per process)
+start_background_refresh()
+
+@st.cache_resource
+def _meta():
+    """
+    Structure-of-arrays currency metadata, built once per process.
+
+    Streamlit reruns the script on every widget interaction, and the
+    per-call accessors (get_currency_codes/get_currency_symbol) each pay a
+    function-call frame plus dict probes. Loading the currency file once
+    into parallel structures turns those into single dict/tuple lookups.
+
+    Returns:
+        dict: {"codes": tuple of currency codes,
+               "code_set": frozenset of the same codes,
+               "symbol": dict mapping code -> symbol}
+    """
+    currencies = load_currencies()
+    codes = tuple(currency["code"] for currency in currencies)
+    symbols = {currency["code"]: currency.get("symbol", "")
+               for currency in currencies}
+    return {
+        "codes": codes,
+        "code_set": frozenset(codes),
+        "symbol": symbols,
+        # Pre-escaped "USD ($)" display labels: escaping and formatting
+        # happen once per process instead of once per table row
+        "label": {code: f"{escape(code)} ({escape(symbol)})"
+                  for code, symbol in symbols.items()},
+    }
+
+@st.cache_data(ttl=300)
+def _cached_rates(base_currency, force_refresh=False):
+    """
+    Cached wrapper around get_exchange_rates().
+
+    Avoids hitting disk/network on every rerun. The 5-minute TTL only
+    bounds how long this layer memoizes; expiry falls through to the
+    currency_utils cache, which applies its own freshness rules. When a
+    forced refresh is requested, callers should clear this cache first
+    (see main()).
+
+    Args:
+        base_currency (str): The base currency code
+        force_refresh (bool): Force refresh from API even if cache is valid
+
+    Returns:
+        tuple: (exchange_rates_dict, last_update_time_string)
+    """
+    return get_exchange_rates(base_currency, force_refresh=force_refresh)
+
+@st.cache_data(ttl=30)
+def _is_online():
+    """
+    Check network connectivity, cached for 30 seconds.
+
+    Delegates to the cheap cached TCP probe in currency_utils (plain
+    connect to Google DNS, no TLS handshake). Repeated checks within a
+    short window reuse the cached result; the Refresh Rates button clears
+    this cache and forces a fresh probe.
+
+    Returns:
+        bool: True if the network is reachable
+    """
+    return _network_available()
 
 # Initialize session state for theme preference
 if "theme" not in st.session_state:
@@ -35,510 +110,146 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+
+# The theme stylesheets live under src/static/ and are served by
+# Streamlit's static file endpoint (enableStaticServing in
+# .streamlit/config.toml). Each rerun only re-emits this tiny <link>
+# tag; the CSS itself is fetched once and then held in the browser
+# cache instead of being re-sent and re-diffed as an inline element.
+# The tag must go through st.markdown(unsafe_allow_html=True): st.html
+# sanitizes with DOMPurify, whose allowlist strips <link> silently.
+_CSS_LINK = {
+    "retro": '<link rel="stylesheet" href="app/static/retro.css">',
+    "standard": '<link rel="stylesheet" href="app/static/standard.css">',
+}
+
+
+# Per-theme styling tokens used by the chart and inline status markup.
+# A single dict lookup replaces the per-call chains of theme ternaries, and
+# a future theme only needs a new entry here rather than edits on hot paths.
+THEMES = {
+    "retro": {
+        "line": "#33ff33",
+        "bg": "black",
+        "grid": "#004400",
+        "text": "#33ff33",
+        "font": "VT323, monospace",
+        "muted": "#33ff33",
+        "warn": "orange",
+    },
+    "standard": {
+        "line": "#0d6efd",
+        "bg": "white",
+        "grid": "#e0e0e0",
+        "text": "#212529",
+        "font": "Roboto, sans-serif",
+        "muted": "#6c757d",
+        "warn": "#fd7e14",
+    },
+}
+
+# Precomputed per-theme header markup; emitted through a single st.markdown
+# call instead of being rebuilt and branch-selected inline in main()
+_HEADER_HTML = {
+    "retro": """
+        <div class='retro-header'>
+            <h1 class='title-neon' style='color: #33ff33; font-size: 36px;'>CURRENCY CONVERTER v1.0</h1>
+            <p style='color: #33ff33; font-size: 20px;'>INTERNATIONAL TRADING SYSTEM</p>
+        </div>
+        """,
+    "standard": """
+        <div class='standard-header'>
+            <h1 style='color: #0d6efd; font-size: 32px;'>Currency Converter</h1>
+            <p style='color: #6c757d; font-size: 18px;'>International Currency Exchange Tool</p>
+        </div>
+        """,
+}
+
 def apply_retro_style():
     """
     Apply retro-themed styling with VT323 font and green-on-black theme.
-    
+
     Uses custom CSS with various retro effects like glowing text, scanlines,
-    and terminal-style UI elements.
+    and terminal-style UI elements. The stylesheet is linked from the
+    static endpoint so the browser caches it; the link tag is emitted
+    via st.markdown with unsafe_allow_html because st.html's sanitizer
+    would strip it.
     """
-    # CSS for enhanced 80s retro terminal look
-    st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=VT323&display=swap');
-    
-    /* Global retro styling */
-    .main {
-        background-color: #000;
-        color: #33ff33;
-        font-family: 'VT323', monospace;
-    }
-    
-    /* Main container styling with terminal border */
-    .block-container {
-        border: 2px solid #33ff33;
-        border-radius: 5px;
-        padding: 20px;
-        box-shadow: 0 0 10px #33ff33;
-        max-width: 1000px !important;
-    }
-    
-    /* Buttons */
-    .stButton>button {
-        background-color: #000;
-        color: #33ff33;
-        border: 2px solid #33ff33;
-        border-radius: 0;
-        font-family: 'VT323', monospace;
-        width: 100%;
-        text-align: left;
-        padding: 15px;
-        font-size: 20px;
-        margin-bottom: 10px;
-        box-shadow: 0 0 5px #33ff33;
-        transition: all 0.3s;
-    }
-    
-    .stButton>button:hover {
-        background-color: #33ff33;
-        color: #000;
-        transform: translateX(5px);
-    }
-    
-    /* Text inputs */
-    .stTextInput>div>div>input, .stNumberInput>div>div>input {
-        background-color: #000;
-        color: #33ff33;
-        border: 2px solid #33ff33;
-        border-radius: 0;
-        font-family: 'VT323', monospace;
-        padding: 10px;
-        box-shadow: 0 0 5px #33ff33;
-    }
-    
-    /* Sidebar styling */
-    .css-1kyxreq, .css-1d391kg, .css-1oe6wy4 {
-        background-color: #000;
-        color: #33ff33;
-    }
-    
-    .css-1kyxreq a, .css-1d391kg a, .css-1oe6wy4 a {
-        color: #33ffff !important;
-    }
-    
-    /* Dialog text box styling */
-    .dialog-text {
-        background-color: #000;
-        color: #33ff33;
-        border: 2px solid #33ff33;
-        padding: 15px;
-        font-family: 'VT323', monospace;
-        margin-bottom: 20px;
-        font-size: 20px;
-        position: relative;
-        box-shadow: 0 0 5px #33ff33;
-    }
-    
-    .dialog-header {
-        color: #ffffff;
-        margin-bottom: 10px;
-        font-weight: bold;
-        font-size: 22px;
-        text-shadow: 0 0 5px #33ff33;
-    }
-    
-    /* Blinking cursor */
-    .terminal-cursor {
-        display: inline-block;
-        background-color: #33ff33;
-        width: 10px;
-        height: 20px;
-        animation: blink 1s step-end infinite;
-    }
-    
-    @keyframes blink {
-        50% { opacity: 0; }
-    }
-    
-    /* Header with scanlines effect */
-    .retro-header {
-        position: relative;
-        padding: 20px;
-        margin-bottom: 30px;
-        text-align: center;
-        overflow: hidden;
-    }
-    
-    .retro-header::before {
-        content: "";
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background: repeating-linear-gradient(
-            transparent 0px,
-            transparent 2px,
-            rgba(0, 0, 0, 0.3) 3px,
-            rgba(0, 0, 0, 0.3) 3px
-        );
-        pointer-events: none;
-    }
-    
-    /* For select boxes */
-    .stSelectbox>div>div>div {
-        background-color: #000 !important;
-        color: #33ff33 !important;
-        border: 2px solid #33ff33 !important;
-    }
-    
-    /* Simple system stats display */
-    .system-stats {
-        font-family: 'VT323', monospace;
-        font-size: 16px;
-        color: #33ff33;
-        border-top: 1px dashed #33ff33;
-        margin-top: 20px;
-        padding-top: 10px;
-    }
-    
-    /* Neon flicker animation for the title */
-    .title-neon {
-        animation: neon-flicker 3s infinite alternate;
-        text-shadow: 0 0 10px #33ff33, 0 0 20px #33ff33;
-    }
-    
-    @keyframes neon-flicker {
-        0%, 19%, 21%, 23%, 25%, 54%, 56%, 100% {
-            text-shadow: 0 0 10px #33ff33, 0 0 20px #33ff33;
-        }
-        20%, 24%, 55% {
-            text-shadow: none;
-        }
-    }
-    
-    /* Result box */
-    .result-box {
-        background-color: #000;
-        color: #33ff33;
-        border: 2px solid #33ff33;
-        padding: 20px;
-        margin: 20px 0;
-        font-family: 'VT323', monospace;
-        font-size: 24px;
-        text-align: center;
-        box-shadow: 0 0 10px #33ff33;
-    }
-    
-    /* Chart container */
-    .chart-container {
-        background-color: #000;
-        border: 2px solid #33ff33;
-        padding: 15px;
-        margin-top: 20px;
-        box-shadow: 0 0 5px #33ff33;
-        overflow-x: auto;
-        max-width: 100%;
-    }
-
-    /* Plotly chart styling overrides */
-    .js-plotly-plot .plotly .main-svg {
-        background-color: transparent !important;
-    }
-
-    .js-plotly-plot .plotly .modebar {
-        filter: invert(100%) sepia(90%) saturate(1000%) hue-rotate(70deg) brightness(150%) contrast(1000%);
-    }
-
-    .js-plotly-plot .plotly .modebar-btn:hover {
-        background-color: rgba(51, 255, 51, 0.3) !important;
-    }
-    
-    /* Table wrapper */
-    .table-wrapper {
-        overflow-x: auto;
-        max-width: 100%;
-        margin-bottom: 10px;
-    }
-    
-    /* Currency table */
-    .currency-table {
-        width: 100%;
-        border-collapse: separate;
-        border-spacing: 2px;
-        font-family: 'VT323', monospace;
-        font-size: 18px;
-        margin-top: 20px;
-        table-layout: fixed;
-        overflow: hidden;
-    }
-    
-    .currency-table th, .currency-table td {
-        border: 1px solid #33ff33;
-        padding: 8px;
-        text-align: left;
-        background-color: rgba(0, 0, 0, 0.8);
-        overflow: hidden;
-        text-overflow: ellipsis;
-        white-space: nowrap;
-    }
-    
-    .currency-table th {
-        background-color: #004400;
-        position: sticky;
-        top: 0;
-        z-index: 1;
-    }
-    
-    .currency-table tr:hover {
-        background-color: #004400;
-    }
-    
-    .currency-table tr:hover td {
-        background-color: #004400;
-        box-shadow: 0 0 5px #33ff33;
-    }
-    
-    /* Theme toggle switch */
-    .theme-toggle {
-        position: absolute;
-        top: 20px;
-        right: 20px;
-        z-index: 1000;
-    }
-    
-    .toggle-label {
-        display: inline-block;
-        margin-right: 10px;
-        font-family: 'VT323', monospace;
-        color: #33ff33;
-        font-size: 16px;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_CSS_LINK["retro"], unsafe_allow_html=True)
 
 def apply_standard_style():
     """
     Apply a clean, professional standard theme styling.
-    Uses a light color scheme with modern UI elements.
+    Uses a light color scheme with modern UI elements. Linked and
+    emitted the same way as the retro stylesheet.
     """
-    st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;500&display=swap');
-    
-    /* Global modern styling */
-    .main {
-        background-color: #f8f9fa;
-        color: #212529;
-        font-family: 'Roboto', sans-serif;
-    }
-    
-    /* Main container styling */
-    .block-container {
-        border: 1px solid #dee2e6;
-        border-radius: 8px;
-        padding: 20px;
-        box-shadow: 0 0 15px rgba(0, 0, 0, 0.05);
-        max-width: 1000px !important;
-        background-color: #ffffff;
-    }
-    
-    /* Buttons */
-    .stButton>button {
-        background-color: #0d6efd;
-        color: white;
-        border: none;
-        border-radius: 4px;
-        font-family: 'Roboto', sans-serif;
-        width: 100%;
-        text-align: center;
-        padding: 10px;
-        font-size: 16px;
-        margin-bottom: 10px;
-        transition: all 0.2s;
-    }
-    
-    .stButton>button:hover {
-        background-color: #0b5ed7;
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Text inputs */
-    .stTextInput>div>div>input, .stNumberInput>div>div>input {
-        background-color: #ffffff;
-        color: #212529;
-        border: 1px solid #ced4da;
-        border-radius: 4px;
-        font-family: 'Roboto', sans-serif;
-        padding: 10px;
-    }
-    
-    /* Dialog text box styling */
-    .dialog-text {
-        background-color: #f8f9fa;
-        color: #212529;
-        border: 1px solid #dee2e6;
-        padding: 15px;
-        font-family: 'Roboto', sans-serif;
-        margin-bottom: 20px;
-        font-size: 16px;
-        position: relative;
-        border-radius: 8px;
-    }
-    
-    .dialog-header {
-        color: #0d6efd;
-        margin-bottom: 10px;
-        font-weight: 500;
-        font-size: 18px;
-    }
-    
-    /* Header */
-    .standard-header {
-        padding: 20px;
-        margin-bottom: 30px;
-        text-align: center;
-        background-color: #ffffff;
-        border-bottom: 1px solid #dee2e6;
-    }
-    
-    /* For select boxes */
-    .stSelectbox>div>div>div {
-        background-color: #ffffff !important;
-        color: #212529 !important;
-        border: 1px solid #ced4da !important;
-        border-radius: 4px !important;
-    }
-    
-    /* System stats display */
-    .system-stats {
-        font-family: 'Roboto', sans-serif;
-        font-size: 14px;
-        color: #6c757d;
-        border-top: 1px solid #dee2e6;
-        margin-top: 20px;
-        padding-top: 10px;
-    }
-    
-    /* Result box */
-    .result-box {
-        background-color: #e9ecef;
-        color: #212529;
-        border: 1px solid #dee2e6;
-        padding: 20px;
-        margin: 20px 0;
-        font-family: 'Roboto', sans-serif;
-        font-size: 18px;
-        text-align: center;
-        border-radius: 8px;
-    }
-    
-    /* Chart container */
-    .chart-container {
-        background-color: #ffffff;
-        border: 1px solid #dee2e6;
-        padding: 15px;
-        margin-top: 20px;
-        border-radius: 8px;
-        overflow-x: auto;
-        max-width: 100%;
-    }
-
-    /* Plotly chart styling overrides for standard theme */
-    .js-plotly-plot .plotly .main-svg {
-        background-color: transparent !important;
-    }
-    
-    /* Table wrapper */
-    .table-wrapper {
-        overflow-x: auto;
-        max-width: 100%;
-        margin-bottom: 10px;
-    }
-    
-    /* Currency table */
-    .currency-table {
-        width: 100%;
-        border-collapse: collapse;
-        font-family: 'Roboto', sans-serif;
-        font-size: 14px;
-        margin-top: 20px;
-        table-layout: fixed;
-        overflow: hidden;
-    }
-    
-    .currency-table th, .currency-table td {
-        border: 1px solid #dee2e6;
-        padding: 8px;
-        text-align: left;
-        background-color: #ffffff;
-        overflow: hidden;
-        text-overflow: ellipsis;
-        white-space: nowrap;
-    }
-    
-    .currency-table th {
-        background-color: #f8f9fa;
-        position: sticky;
-        top: 0;
-        z-index: 1;
-        font-weight: 500;
-    }
-    
-    .currency-table tr:hover {
-        background-color: #f1f3f5;
-    }
-    
-    .currency-table tr:hover td {
-        background-color: #f1f3f5;
-    }
-    
-    /* Theme toggle switch */
-    .theme-toggle {
-        position: absolute;
-        top: 20px;
-        right: 20px;
-        z-index: 1000;
-    }
-    
-    .toggle-label {
-        display: inline-block;
-        margin-right: 10px;
-        font-family: 'Roboto', sans-serif;
-        color: #212529;
-        font-size: 14px;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_CSS_LINK["standard"], unsafe_allow_html=True)
 
 def apply_theme_style():
     """Apply styling based on the current theme setting"""
+    # The style element must be re-emitted on every rerun: Streamlit removes
+    # any element a script run does not produce, so a session-state sentinel
+    # that skips emission would drop the stylesheet after the first
+    # interaction. The string itself is a precomputed module constant, so
+    # the per-rerun cost is just the markdown delta.
     if st.session_state.theme == "retro":
         apply_retro_style()
     else:
         apply_standard_style()
 
-def display_system_info():
+@lru_cache(maxsize=4)
+def _sysinfo_for(theme, epoch_sec):
     """
-    Display a system information box with current date and time.
-    Style depends on the current theme setting.
-    
+    Formatted system-info banner for a given theme and wall-clock second.
+
+    display_system_info runs on every rerun; keying on int(time.time())
+    means bursts of reruns within the same second reuse the finished
+    string instead of paying datetime.now plus two strftime calls. The
+    displayed resolution is one second, so the memoization is visually
+    lossless, and lru_cache is cheaper than a st.cache_data lookup for a
+    plain string. maxsize=4 keeps current and previous seconds per theme.
+
+    Args:
+        theme (str): 'retro' or 'standard'
+        epoch_sec (int): Unix timestamp truncated to the second
+
     Returns:
-        str: Formatted system information
+        str: Formatted system information banner
     """
-    now = datetime.now()
-    
-    if st.session_state.theme == "retro":
-        # Retro-styled ASCII art box
-        system_info = f"""
+    now = datetime.fromtimestamp(epoch_sec)
+    return _SYSINFO_TEMPLATE[theme].format(
+        date_str=now.strftime('%Y-%m-%d'), time_str=now.strftime('%H:%M:%S'))
+
+# System-info boxes with only the clock left as placeholders; everything
+# else in the banner is invariant and parsed once at import
+_SYSINFO_TEMPLATE = {
+    "retro": """
         ╔═══════════════════════════════════════════════════╗
         ║ RETRO-COMPUTER 8000 | CURRENCY v1.0               ║
-        ║ DATE: {now.strftime('%Y-%m-%d')} | TIME: {now.strftime('%H:%M:%S')} ║
+        ║ DATE: {date_str} | TIME: {time_str} ║
         ║ MEMORY: 64K RAM SYSTEM  38911 BASIC BYTES FREE    ║
         ╚═══════════════════════════════════════════════════╝
-        """
-    else:
-        # Modern info display
-        system_info = f"""
+        """,
+    "standard": """
         Currency Converter v1.0
-        Date: {now.strftime('%Y-%m-%d')} | Time: {now.strftime('%H:%M:%S')}
+        Date: {date_str} | Time: {time_str}
         © 2025 Modern Systems Inc.
-        """
-    
-    return system_info
+        """,
+}
 
-def create_history_table(conversion_history):
+def display_system_info():
     """
-    Create an HTML table displaying conversion history.
+    Display a system information box with current date and time.
+    Style depends on the current theme setting.
     
-    Args:
-        conversion_history (list): List of conversion records
-        
     Returns:
-        str: HTML table markup for the conversion history
+        str: Formatted system information
     """
-    table_html = """
+    return _sysinfo_for(st.session_state.theme, int(time.time()))
+
+# Static table markup, parsed once at import. The row templates are plain
+# str.format strings so each render only fills in the per-row values.
+_HISTORY_TABLE_OPEN = """
     <div class="table-wrapper">
     <table class="currency-table">
         <thead>
@@ -552,30 +263,179 @@ def create_history_table(conversion_history):
         </thead>
         <tbody>
     """
-    
-    # Add rows for each conversion
-    for conv in conversion_history:
-        # Add simple XSS protection by escaping values
-        timestamp = conv["timestamp"].replace("<", "&lt;").replace(">", "&gt;")
-        from_currency = conv["from_currency"].replace("<", "&lt;").replace(">", "&gt;")
-        to_currency = conv["to_currency"].replace("<", "&lt;").replace(">", "&gt;")
-        
-        table_html += f"""
+
+_HISTORY_ROW = """
         <tr>
             <td>{timestamp}</td>
             <td>{from_currency}</td>
-            <td>{conv["amount"]:.2f}</td>
+            <td>{amount:.2f}</td>
             <td>{to_currency}</td>
-            <td>{conv["result"]:.2f}</td>
+            <td>{result:.2f}</td>
         </tr>
         """
-    
-    table_html += """
+
+_RATES_TABLE_OPEN = """
+    <div class="table-wrapper">
+    <table class="currency-table">
+        <thead>
+            <tr>
+                <th style="width: 60%;">Currency</th>
+                <th style="width: 40%;">Rate</th>
+            </tr>
+        </thead>
+        <tbody>
+    """
+
+_RATES_ROW = """
+        <tr>
+            <td>{label}</td>
+            <td>{rate}</td>
+        </tr>
+        """
+
+_TABLE_CLOSE = """
         </tbody>
     </table>
     </div>
     """
-    return table_html
+
+def create_history_table(conversion_history):
+    """
+    Create an HTML table displaying conversion history.
+    
+    Args:
+        conversion_history (list): List of conversion records
+        
+    Returns:
+        str: HTML table markup for the conversion history
+    """
+    # Build one row string per conversion and join once at the end.
+    # format_map fills the template straight from the record dict (no
+    # per-keyword repacking); the string fields are swapped for escaped
+    # copies first, covering &, quotes and angle brackets
+    parts = [_HISTORY_TABLE_OPEN]
+    parts.extend(
+        _HISTORY_ROW.format_map({
+            **conv,
+            "timestamp": escape(conv["timestamp"]),
+            "from_currency": escape(conv["from_currency"]),
+            "to_currency": escape(conv["to_currency"]),
+        })
+        for conv in conversion_history
+    )
+    parts.append(_TABLE_CLOSE)
+    return "".join(parts)
+
+@st.cache_data
+def _history_table_html(history_rows):
+    """
+    Cached HTML for the conversion history table.
+
+    Keyed on the tuple of row values, so reruns triggered by unrelated
+    widgets reuse the rendered string instead of re-escaping and
+    re-formatting every row.
+
+    Args:
+        history_rows (tuple): Tuples of (timestamp, from_currency, amount,
+            to_currency, result)
+
+    Returns:
+        str: HTML table markup for the conversion history
+    """
+    return create_history_table([
+        {
+            "timestamp": timestamp,
+            "from_currency": from_currency,
+            "amount": amount,
+            "to_currency": to_currency,
+            "result": result,
+        }
+        for timestamp, from_currency, amount, to_currency, result in history_rows
+    ])
+
+@st.cache_data(ttl=3600)
+def _historical_series(base_currency, target_currency, days, force_refresh=False):
+    """
+    Fetch and extract the (dates, rates) series for the historical chart.
+
+    Cached separately from figure construction so repeat renders with the
+    same parameters skip the historical data fetch and sort entirely. The
+    Plotly Figure itself is rebuilt cheaply from these small lists (caching
+    whole Figure objects is memory-heavy and theme-dependent).
+
+    Args:
+        base_currency (str): The base currency code
+        target_currency (str): The target currency code
+        days (int): Number of days of historical data
+        force_refresh (bool): Force refresh from API even if cache is valid
+
+    Returns:
+        tuple: (list of date strings, float32 ndarray of rates) sorted by
+            date ascending
+    """
+    historical_data = get_historical_rates(base_currency, days, force_refresh=force_refresh)
+
+    # Single pass over the sorted items; the rates go out as a typed NumPy
+    # array, which Scattergl consumes directly without per-point boxing
+    pairs = [(date, day_rates[target_currency])
+             for date, day_rates in sorted(historical_data.items())
+             if target_currency in day_rates]
+    if not pairs:
+        return [], np.empty(0, dtype=np.float32)
+
+    dates, rates = zip(*pairs)
+    return list(dates), np.asarray(rates, dtype=np.float32)
+
+# Maximum number of points handed to Plotly; roughly twice the pixel width
+# of the chart area, beyond which extra points cost render time but add no
+# visible detail.
+_MAX_CHART_POINTS = 500
+
+def _downsample_lttb(dates, rates, threshold):
+    """
+    Downsample a time series with Largest-Triangle-Three-Buckets (LTTB).
+
+    LTTB picks the point in each bucket that forms the largest triangle with
+    its neighbours, preserving the visual shape of the line while capping the
+    number of points sent to the frontend.
+
+    Args:
+        dates (list): Date strings, sorted ascending
+        rates (list): Rate values matching dates
+        threshold (int): Target number of output points (>= 3)
+
+    Returns:
+        tuple: (downsampled dates, downsampled rates)
+    """
+    n = len(rates)
+    if threshold >= n or threshold < 3:
+        return dates, rates
+
+    x = np.arange(n, dtype=np.float64)
+    y = np.asarray(rates, dtype=np.float64)
+
+    # First and last points are always kept
+    sampled = [0]
+    bucket_edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+
+    prev = 0
+    for i in range(threshold - 2):
+        lo, hi = bucket_edges[i], bucket_edges[i + 1]
+        # Average of the next bucket acts as the third triangle vertex
+        nxt_lo, nxt_hi = hi, bucket_edges[i + 2] if i + 2 < len(bucket_edges) else n
+        avg_x = x[nxt_lo:nxt_hi].mean()
+        avg_y = y[nxt_lo:nxt_hi].mean()
+
+        # Pick the point in this bucket with the largest triangle area
+        areas = np.abs(
+            (x[prev] - avg_x) * (y[lo:hi] - y[prev])
+            - (x[prev] - x[lo:hi]) * (avg_y - y[prev])
+        )
+        prev = lo + int(areas.argmax())
+        sampled.append(prev)
+
+    sampled.append(n - 1)
+    return [dates[i] for i in sampled], [rates[i] for i in sampled]
 
 def create_historical_chart(base_currency, target_currency, days=30):
     """
@@ -589,32 +449,39 @@ def create_historical_chart(base_currency, target_currency, days=30):
     Returns:
         plotly.graph_objects.Figure: Interactive chart figure
     """
-    # Get historical rates data with force_refresh from session state
-    force_refresh = st.session_state.get('force_refresh', False)
-    historical_data = get_historical_rates(base_currency, days, force_refresh=force_refresh)
-
-    # Prepare data for the chart
-    dates = []
-    rates = []
-
-    # Sort dates in ascending order
-    for date in sorted(historical_data.keys()):
-        if target_currency in historical_data[date]:
-            dates.append(date)
-            rates.append(historical_data[date][target_currency])
+    # Imported here rather than at module top: plotly costs a few hundred
+    # ms to import and is only needed once the user actually converts.
+    # sys.modules makes repeat imports free.
+    import plotly.graph_objects as go
 
-    # Set colors based on theme
-    line_color = "#33ff33" if st.session_state.theme == "retro" else "#0d6efd"
-    bg_color = "black" if st.session_state.theme == "retro" else "white"
-    grid_color = "#004400" if st.session_state.theme == "retro" else "#e0e0e0"
-    text_color = "#33ff33" if st.session_state.theme == "retro" else "#212529"
+    # Get historical series with force_refresh from session state
+    force_refresh = st.session_state.get('force_refresh', False)
+    if force_refresh:
+        _historical_series.clear()
+    dates, rates = _historical_series(base_currency, target_currency, days,
+                                      force_refresh=force_refresh)
+
+    # Downsample long series before handing them to Plotly so the frontend
+    # never has to paint more points than the chart can show
+    if len(rates) > _MAX_CHART_POINTS:
+        dates, rates = _downsample_lttb(dates, rates, _MAX_CHART_POINTS)
+
+    # Look up the styling tokens for the active theme once
+    tokens = THEMES[st.session_state.theme]
+    line_color = tokens["line"]
+    bg_color = tokens["bg"]
+    grid_color = tokens["grid"]
+    text_color = tokens["text"]
+    font_family = tokens["font"]
 
     # Create the figure
     fig = go.Figure()
 
-    # Add the line trace
+    # Add the line trace. Scattergl renders via WebGL, which paints faster
+    # than SVG and leaves headroom for longer history periods. Browsers
+    # without WebGL fall back to Plotly's software rendering.
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=dates,
             y=rates,
             mode='lines+markers',
@@ -631,9 +498,9 @@ def create_historical_chart(base_currency, target_currency, days=30):
         yaxis_title=f'Rate (1 {base_currency} to {target_currency})',
         plot_bgcolor=bg_color,
         paper_bgcolor=bg_color,
-        font=dict(color=text_color, family="VT323, monospace" if st.session_state.theme == "retro" else "Roboto, sans-serif"),
-        xaxis=dict(gridcolor=grid_color, tickfont=dict(family="VT323, monospace" if st.session_state.theme == "retro" else "Roboto, sans-serif")),
-        yaxis=dict(gridcolor=grid_color, tickfont=dict(family="VT323, monospace" if st.session_state.theme == "retro" else "Roboto, sans-serif")),
+        font=dict(color=text_color, family=font_family),
+        xaxis=dict(gridcolor=grid_color, tickfont=dict(family=font_family)),
+        yaxis=dict(gridcolor=grid_color, tickfont=dict(family=font_family)),
         margin=dict(t=50, b=50, l=50, r=50),
         height=400,
     )
@@ -651,48 +518,345 @@ def create_rates_table(rates, currency_codes):
     Returns:
         str: HTML table markup for the exchange rates
     """
-    table_html = """
-    <div class="table-wrapper">
-    <table class="currency-table">
-        <thead>
-            <tr>
-                <th style="width: 60%;">Currency</th>
-                <th style="width: 40%;">Rate</th>
-            </tr>
-        </thead>
-        <tbody>
+    # Hash-based membership: the API returns far more currencies than we
+    # display, and an `in` test against a list is a linear scan per row
+    codes_set = (currency_codes
+                 if isinstance(currency_codes, (set, frozenset))
+                 else frozenset(currency_codes))
+
+    # Two passes: first format every cell value in a tight list
+    # comprehension (label lookup hits the pre-escaped map in _meta, so
+    # only the float formatting runs per row), then fill the row template
+    # and join once at the end
+    labels = _meta()["label"]
+    cells = [
+        (labels[code], f"{rate:.4f}")
+        for code, rate in rates.items()
+        if code in codes_set  # Only show rates for our defined currencies
+    ]
+    parts = [_RATES_TABLE_OPEN]
+    parts.extend(_RATES_ROW.format(label=label, rate=rate)
+                 for label, rate in cells)
+    parts.append(_TABLE_CLOSE)
+    return "".join(parts)
+
+@st.cache_data
+def _rates_table_html(rate_items, currency_codes):
     """
+    Cached HTML for the exchange rates table.
 
-    # Add rows for each currency rate
-    for code, rate in rates.items():
-        if code in currency_codes:  # Only show rates for our defined currencies
-            # Get symbol with fallback to empty string
-            symbol = get_currency_symbol(code) or ""
-            # Add simple XSS protection
-            code_safe = code.replace("<", "&lt;").replace(">", "&gt;")
-            symbol_safe = symbol.replace("<", "&lt;").replace(">", "&gt;")
+    Keyed on the (code, rate) tuples and the code collection, so while the
+    rates memo holds the same snapshot every sidebar render reuses the
+    rendered string instead of re-escaping and re-formatting ~30 rows.
 
-            table_html += f"""
-            <tr>
-                <td>{code_safe} ({symbol_safe})</td>
-                <td>{rate:.4f}</td>
-            </tr>
-            """
+    Args:
+        rate_items (tuple): Tuple of (code, rate) pairs
+        currency_codes (frozenset): Valid currency codes
 
-    table_html += """
-        </tbody>
-    </table>
-    </div>
+    Returns:
+        str: HTML table markup for the exchange rates
     """
-    return table_html
+    return create_rates_table(dict(rate_items), currency_codes)
+
+def _clear_history():
+    """
+    Reset the conversion history.
+
+    Used as the CLEAR HISTORY button's on_click callback so the reset is
+    applied before the click's own rerun renders the page.
+    """
+    st.session_state.conversion_history = deque(maxlen=10)
 
 def toggle_theme():
-    """Toggle between retro and standard themes"""
+    """
+    Toggle between retro and standard themes.
+
+    Used as a button on_click callback: Streamlit runs callbacks before the
+    rerun it already schedules for the click, so the new theme applies in
+    that same rerun without an explicit st.rerun().
+    """
     if st.session_state.theme == "retro":
         st.session_state.theme = "standard"
     else:
         st.session_state.theme = "retro"
-    st.rerun()  # Rerun the app to apply the new theme
+
+@st.fragment
+def _historical_section(from_currency, to_currency):
+    """
+    Render the historical exchange rate chart with its period selector.
+
+    Wrapped in st.fragment so changing the period reruns only this block
+    instead of the whole script (which would also drop the chart, since the
+    convert button state does not persist across full reruns).
+
+    Args:
+        from_currency (str): The base currency code
+        to_currency (str): The target currency code
+    """
+    # Show historical chart
+    st.markdown("<h3 style='color: #33ff33;'>HISTORICAL EXCHANGE RATE</h3>", unsafe_allow_html=True)
+
+    # Add period selector for historical data
+    col_period, col_spacer = st.columns([1, 1])
+    with col_period:
+        period = st.selectbox(
+            "SELECT PERIOD:",
+            ["7 days", "14 days", "30 days", "60 days"],
+            index=2,  # Default to 30 days
+            help="Select the historical period to display"
+        )
+
+    # Convert period string to number of days
+    days = int(period.split()[0])
+
+    # Create and display historical chart
+    try:
+        # Pass the force_refresh flag to the historical data function
+        fig = create_historical_chart(from_currency, to_currency, days)
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Add an appropriate note about data source based on online status
+        if st.session_state.is_online:
+            if st.session_state.theme == "retro":
+                st.markdown("<p style='color: #33ff33; font-size: 14px; text-align: center;'>DATA SOURCE: ONLINE API WITH OFFLINE CACHE FALLBACK</p>", unsafe_allow_html=True)
+            else:
+                st.markdown("<p style='color: #6c757d; font-size: 14px; text-align: center;'>Data Source: Online API with offline cache fallback</p>", unsafe_allow_html=True)
+        else:
+            if st.session_state.theme == "retro":
+                st.markdown("<p style='color: orange; font-size: 14px; text-align: center;'>OFFLINE MODE: USING CACHED DATA / SAMPLE DATA</p>", unsafe_allow_html=True)
+            else:
+                st.markdown("<p style='color: #fd7e14; font-size: 14px; text-align: center;'>Offline Mode: Using cached data / sample data</p>", unsafe_allow_html=True)
+    except Exception as e:
+        st.error(f"Error creating historical chart: {str(e)}")
+
+# Static sidebar chrome selected by theme: the wrapper halves around the
+# system-info banner and the footer block, joined into one markdown delta
+_SYSINFO_WRAP = {
+    "retro": ("<pre style='color: #33ff33; font-family: VT323, monospace;'>",
+              "</pre>"),
+    "standard": ("<div style='color: #6c757d; font-family: Roboto, sans-serif; background-color: #f8f9fa; padding: 10px; border-radius: 4px; border: 1px solid #dee2e6;'>",
+                 "</div>"),
+}
+
+_FOOTER_HTML = {
+    "retro": """
+        <div class="system-stats">
+            <p>SYSTEM PERFORMANCE: NOMINAL</p>
+            <p>EXCHANGE DATA: ONLINE</p>
+            <p>CONNECTION: SECURE</p>
+            <p>(C) RETRO SYSTEMS INC. 2025</p>
+        </div>
+        """,
+    "standard": """
+        <div class="system-stats">
+            <p>System Status: Online</p>
+            <p>Data Source: Open Exchange Rates API</p>
+            <p>© 2025 Modern Systems Inc.</p>
+        </div>
+        """,
+}
+
+# Per-theme sidebar heading, concatenated with the status line so the
+# pair is sent as one element
+_RATES_HEADING = {
+    "retro": "<h3 style='color: #33ff33;'>CURRENT EXCHANGE RATES</h3>",
+    "standard": "<h3>Current Exchange Rates</h3>",
+}
+
+# Maps the status suffix appended by get_exchange_rates to the THEMES color
+# key and display label used in the sidebar status line
+_STATUS_BY_SUFFIX = {
+    " (cached)": ("muted", "Cache"),
+    " (offline mode)": ("warn", "Cache (OFFLINE)"),
+    " (sample data)": ("warn", "Sample Data"),
+}
+
+@st.fragment
+def _rates_sidebar(currency_codes, force_refresh):
+    """
+    Render the exchange rates panel, system info, and footer.
+
+    Wrapped in st.fragment so interactions elsewhere in the app (amount
+    typing, currency selection) do not re-execute the rates fetch and
+    table construction.
+
+    Args:
+        currency_codes (list): List of valid currency codes
+        force_refresh (bool): Force refresh of rates from the API
+    """
+    theme = st.session_state.theme
+
+    # Error backoff: after a failed render, skip re-attempting the fetch
+    # for 30 seconds so a dead network does not add a timeout to every
+    # rerun; the refresh button path still works once the window passes
+    if st.session_state.get("_rates_error_until", 0) > time.time():
+        st.warning("Exchange rates temporarily unavailable, retrying shortly.")
+        return
+
+    try:
+        # Get exchange rates for USD, respecting force_refresh flag
+        rates, last_update = _cached_rates("USD", force_refresh=force_refresh)
+
+        # Heading and status line go out as one delta; the status suffix is
+        # looked up instead of branching per theme
+        heading = _RATES_HEADING[theme]
+        suffix = next((k for k in _STATUS_BY_SUFFIX if k in last_update), None)
+        if suffix:
+            color_key, source = _STATUS_BY_SUFFIX[suffix]
+            stamp = last_update.replace(suffix, "")
+        else:
+            color_key, source, stamp = "muted", "API", last_update
+        color = THEMES[theme][color_key]
+
+        # The whole panel — heading, status line, rates table, system
+        # info, and footer — is adjacent static HTML, so concatenate it
+        # and send one element instead of three
+        table_html = _rates_table_html(tuple(rates.items()), _meta()["code_set"])
+        wrap_open, wrap_close = _SYSINFO_WRAP[theme]
+        st.markdown(
+            f"{heading}"
+            f"<p style='color: {color};'>Base: USD | Source: {source} | {stamp}</p>"
+            f"<div class='chart-container'>{table_html}</div>"
+            f"{wrap_open}{display_system_info()}{wrap_close}"
+            f"{_FOOTER_HTML[theme]}",
+            unsafe_allow_html=True,
+        )
+        
+    except (requests.RequestException, TimeoutError, KeyError) as error:
+        # Expected failure modes: network trouble or a malformed rates
+        # payload. Anything else should surface as a real traceback rather
+        # than being swallowed here.
+        st.session_state["_rates_error_until"] = time.time() + 30
+        st.error(f"Error displaying exchange rates: {str(error)}")
+
+
+def _convert_via_usd(amount, from_currency, to_currency):
+    """
+    Convert using the already-memoized USD rates snapshot.
+
+    The sidebar fetches USD-based rates through _cached_rates every
+    render; deriving the conversion as a cross-rate from that same
+    snapshot means one rerun performs a single rates lookup for both
+    columns instead of a second base-specific fetch. Falls back to
+    convert_currency (which fetches with from_currency as base) when a
+    code is missing from the table.
+
+    Args:
+        amount (float): The amount to convert
+        from_currency (str): The source currency code
+        to_currency (str): The target currency code
+
+    Returns:
+        float or None: The converted amount, or None on failure
+    """
+    try:
+        rates, _ = _cached_rates("USD")
+        from_rate = rates.get(from_currency)
+        to_rate = rates.get(to_currency)
+        if from_rate and to_rate:
+            return abs(amount) * to_rate / from_rate
+    except (requests.RequestException, TimeoutError, KeyError):
+        pass
+    return convert_currency(amount, from_currency, to_currency)
+
+@st.fragment
+def _converter(currency_codes):
+    """
+    Render the converter form, result box, and conversion history.
+
+    Wrapped in st.fragment so the convert and clear-history buttons rerun
+    only this column: the header, rates panel, and the rest of the script
+    are untouched by those clicks.
+
+    Args:
+        currency_codes (tuple): Available currency codes
+    """
+    st.markdown("<h2 style='color: #33ff33;'>CURRENCY EXCHANGE TERMINAL</h2>", unsafe_allow_html=True)
+    
+    # Inputs live in a form so edits are batched into a single rerun on
+    # submit instead of one full rerun per keystroke/selection
+    with st.form("convert_form"):
+        # Input for amount
+        amount = st.number_input(
+            "ENTER AMOUNT:",
+            min_value=0.01,
+            value=100.00,
+            step=10.0,
+            help="Enter the amount you want to convert"
+        )
+
+        # Select boxes for currencies
+        col1a, col1b = st.columns(2)
+        with col1a:
+            from_currency = st.selectbox(
+                "FROM CURRENCY:",
+                currency_codes,
+                index=0,
+                help="Select the source currency"
+            )
+        with col1b:
+            # Default to a different currency than the 'from' currency if possible
+            default_to_index = 1 if len(currency_codes) > 1 else 0
+            to_currency = st.selectbox(
+                "TO CURRENCY:",
+                currency_codes,
+                index=default_to_index,
+                help="Select the target currency"
+            )
+
+        # Convert button
+        submitted = st.form_submit_button("CONVERT CURRENCY")
+
+    if submitted:
+        # Get the conversion result from the shared USD snapshot
+        result = _convert_via_usd(amount, from_currency, to_currency)
+        
+        if result is not None:
+            # Format the result
+            symbols = _meta()["symbol"]
+            from_symbol = symbols.get(from_currency, "")
+            to_symbol = symbols.get(to_currency, "")
+            
+            # Display the result
+            st.markdown(f"""
+            <div class='result-box'>
+                {from_symbol}{amount:.2f} {from_currency} = {to_symbol}{result:.2f} {to_currency}
+            </div>
+            """, unsafe_allow_html=True)
+
+            # Add to conversion history (deque drops the oldest entry
+            # beyond 10 automatically)
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            st.session_state.conversion_history.append({
+                "timestamp": timestamp,
+                "from_currency": from_currency,
+                "to_currency": to_currency,
+                "amount": amount,
+                "result": result
+            })
+
+            # Show historical chart (fragment: period changes rerun only this block)
+            _historical_section(from_currency, to_currency)
+        else:
+            st.error("CONVERSION ERROR: Could not retrieve exchange rate.")
+    
+    # Conversion History Section
+    if len(st.session_state.conversion_history) > 0:
+        # Heading, wrapper div and table (HTML cached on the row
+        # values) are sent together as a single element
+        table_html = _history_table_html(tuple(
+            (conv["timestamp"], conv["from_currency"], conv["amount"],
+             conv["to_currency"], conv["result"])
+            for conv in st.session_state.conversion_history
+        ))
+        st.markdown("<h3 style='color: #33ff33;'>CONVERSION HISTORY</h3>"
+                    f"<div class='chart-container'>{table_html}</div>", unsafe_allow_html=True)
+        
+        # Add clear history button; the callback runs before the rerun
+        # the click already schedules, so the emptied history is what
+        # renders — no second st.rerun() pass needed
+        st.button("CLEAR HISTORY", on_click=_clear_history)
+
 
 def main():
     """
@@ -701,30 +865,29 @@ def main():
     # Apply styling based on current theme
     apply_theme_style()
 
-    # Initialize session state for conversion history
+    # Initialize session state for conversion history; deque(maxlen=10)
+    # enforces the history cap in C with no reallocation
     if "conversion_history" not in st.session_state:
-        st.session_state.conversion_history = []
+        st.session_state.conversion_history = deque(maxlen=10)
 
-    # Initialize online state detection
+    # Initialize online state detection (cached probe, see _is_online)
     if "is_online" not in st.session_state:
-        # Check network connectivity
-        try:
-            requests.get("https://8.8.8.8", timeout=1)
-            st.session_state.is_online = True
-        except:
-            st.session_state.is_online = False
+        st.session_state.is_online = _is_online()
 
     # Initialize force refresh setting
     if "force_refresh" not in st.session_state:
         st.session_state.force_refresh = False
 
+    # Bind the theme once for this rerun; session_state reads go through a
+    # proxy and the value cannot change mid-script
+    theme = st.session_state.theme
+
     # Top row with theme toggle and online status
     col_toggle, col_status, col_refresh, col_spacer = st.columns([1, 1, 1, 3])
 
     with col_toggle:
-        theme_label = "🌙 Retro" if st.session_state.theme == "retro" else "☀️ Standard"
-        if st.button(f"Switch to {theme_label}", key="theme_toggle"):
-            toggle_theme()
+        theme_label = "🌙 Retro" if theme == "retro" else "☀️ Standard"
+        st.button(f"Switch to {theme_label}", key="theme_toggle", on_click=toggle_theme)
 
     with col_status:
         if st.session_state.is_online:
@@ -734,38 +897,28 @@ def main():
 
     with col_refresh:
         if st.button("🔄 Refresh Rates", key="refresh_rates"):
-            # Check network connectivity again when refresh is requested
-            try:
-                requests.get("https://8.8.8.8", timeout=1)
-                st.session_state.is_online = True
+            # Re-probe connectivity when a refresh is explicitly requested
+            _is_online.clear()
+            st.session_state.is_online = _network_available(force_check=True)
+            if st.session_state.is_online:
                 st.session_state.force_refresh = True
                 st.success("Refreshing rates from server...")
-            except:
-                st.session_state.is_online = False
+            else:
                 st.warning("Unable to connect. Using cached rates.")
 
     # Reset force refresh after it's been used
     force_refresh = st.session_state.force_refresh
     st.session_state.force_refresh = False
+
+    # Drop the memoized rates so the forced refresh actually reaches the API
+    if force_refresh:
+        _cached_rates.clear()
     
-    # Header with styling based on theme
-    if st.session_state.theme == "retro":
-        st.markdown("""
-        <div class='retro-header'>
-            <h1 class='title-neon' style='color: #33ff33; font-size: 36px;'>CURRENCY CONVERTER v1.0</h1>
-            <p style='color: #33ff33; font-size: 20px;'>INTERNATIONAL TRADING SYSTEM</p>
-        </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown("""
-        <div class='standard-header'>
-            <h1 style='color: #0d6efd; font-size: 32px;'>Currency Converter</h1>
-            <p style='color: #6c757d; font-size: 18px;'>International Currency Exchange Tool</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # Header with styling based on theme (precomputed, single delta)
+    st.markdown(_HEADER_HTML[theme], unsafe_allow_html=True)
     
     # Get all available currencies - do this once at the beginning
-    currency_codes = get_currency_codes()
+    currency_codes = _meta()["codes"]
     
     # Check if we have any currencies
     if not currency_codes:
@@ -775,194 +928,13 @@ def main():
     # Main content area
     col1, col2 = st.columns([2, 1])
     
-    # Currency converter section
+    # Currency converter section (fragment: its buttons rerun only col1)
     with col1:
-        st.markdown("<h2 style='color: #33ff33;'>CURRENCY EXCHANGE TERMINAL</h2>", unsafe_allow_html=True)
-        
-        # Input for amount
-        amount = st.number_input(
-            "ENTER AMOUNT:", 
-            min_value=0.01, 
-            value=100.00, 
-            step=10.0,
-            help="Enter the amount you want to convert"
-        )
-        
-        # Select boxes for currencies
-        col1a, col1b = st.columns(2)
-        with col1a:
-            from_currency = st.selectbox(
-                "FROM CURRENCY:", 
-                currency_codes, 
-                index=0,
-                help="Select the source currency"
-            )
-        with col1b:
-            # Default to a different currency than the 'from' currency if possible
-            default_to_index = 1 if len(currency_codes) > 1 else 0
-            to_currency = st.selectbox(
-                "TO CURRENCY:", 
-                currency_codes, 
-                index=default_to_index,
-                help="Select the target currency"
-            )
-        
-        # Convert button
-        if st.button("CONVERT CURRENCY"):
-            # Get the conversion result
-            result = convert_currency(amount, from_currency, to_currency)
-            
-            if result is not None:
-                # Format the result
-                from_symbol = get_currency_symbol(from_currency) or ""
-                to_symbol = get_currency_symbol(to_currency) or ""
-                
-                # Display the result
-                st.markdown(f"""
-                <div class='result-box'>
-                    {from_symbol}{amount:.2f} {from_currency} = {to_symbol}{result:.2f} {to_currency}
-                </div>
-                """, unsafe_allow_html=True)
-
-                # Add to conversion history (limit to last 10 for performance)
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                st.session_state.conversion_history.append({
-                    "timestamp": timestamp,
-                    "from_currency": from_currency,
-                    "to_currency": to_currency,
-                    "amount": amount,
-                    "result": result
-                })
-
-                # Keep only the last 10 conversions
-                if len(st.session_state.conversion_history) > 10:
-                    st.session_state.conversion_history = st.session_state.conversion_history[-10:]
-
-                # Show historical chart
-                st.markdown("<h3 style='color: #33ff33;'>HISTORICAL EXCHANGE RATE</h3>", unsafe_allow_html=True)
-
-                # Add period selector for historical data
-                col_period, col_spacer = st.columns([1, 1])
-                with col_period:
-                    period = st.selectbox(
-                        "SELECT PERIOD:",
-                        ["7 days", "14 days", "30 days", "60 days"],
-                        index=2,  # Default to 30 days
-                        help="Select the historical period to display"
-                    )
-
-                # Convert period string to number of days
-                days = int(period.split()[0])
-
-                # Create and display historical chart
-                try:
-                    # Pass the force_refresh flag to the historical data function
-                    fig = create_historical_chart(from_currency, to_currency, days)
-                    st.plotly_chart(fig, use_container_width=True)
-
-                    # Add an appropriate note about data source based on online status
-                    if st.session_state.is_online:
-                        if st.session_state.theme == "retro":
-                            st.markdown("<p style='color: #33ff33; font-size: 14px; text-align: center;'>DATA SOURCE: ONLINE API WITH OFFLINE CACHE FALLBACK</p>", unsafe_allow_html=True)
-                        else:
-                            st.markdown("<p style='color: #6c757d; font-size: 14px; text-align: center;'>Data Source: Online API with offline cache fallback</p>", unsafe_allow_html=True)
-                    else:
-                        if st.session_state.theme == "retro":
-                            st.markdown("<p style='color: orange; font-size: 14px; text-align: center;'>OFFLINE MODE: USING CACHED DATA / SAMPLE DATA</p>", unsafe_allow_html=True)
-                        else:
-                            st.markdown("<p style='color: #fd7e14; font-size: 14px; text-align: center;'>Offline Mode: Using cached data / sample data</p>", unsafe_allow_html=True)
-                except Exception as e:
-                    st.error(f"Error creating historical chart: {str(e)}")
-            else:
-                st.error("CONVERSION ERROR: Could not retrieve exchange rate.")
-        
-        # Conversion History Section
-        if len(st.session_state.conversion_history) > 0:
-            st.markdown("<h3 style='color: #33ff33;'>CONVERSION HISTORY</h3>", unsafe_allow_html=True)
-            
-            # Display conversion history as a simple table
-            st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
-            
-            # Create HTML table
-            table_html = create_history_table(st.session_state.conversion_history)
-            # Important: use st.write to render HTML properly, not st.markdown
-            st.write(table_html, unsafe_allow_html=True)
-            st.markdown("</div>", unsafe_allow_html=True)
-            
-            # Add clear history button
-            if st.button("CLEAR HISTORY"):
-                st.session_state.conversion_history = []
-                st.rerun()
+        _converter(currency_codes)
     
     # Sidebar with exchange rates and settings
     with col2:
-        try:
-            # Get exchange rates for USD, respecting force_refresh flag
-            rates, last_update = get_exchange_rates("USD", force_refresh=force_refresh)
-
-            # Format the heading based on the theme
-            if st.session_state.theme == "retro":
-                st.markdown("<h3 style='color: #33ff33;'>CURRENT EXCHANGE RATES</h3>", unsafe_allow_html=True)
-
-                # Parse last_update to show appropriate status
-                if "(cached)" in last_update:
-                    st.markdown(f"<p style='color: #33ff33;'>Base: USD | Source: Cache | {last_update.replace(' (cached)', '')}</p>", unsafe_allow_html=True)
-                elif "(offline mode)" in last_update:
-                    st.markdown(f"<p style='color: orange;'>Base: USD | Source: Cache (OFFLINE) | {last_update.replace(' (offline mode)', '')}</p>", unsafe_allow_html=True)
-                elif "(sample data)" in last_update:
-                    st.markdown(f"<p style='color: orange;'>Base: USD | Source: Sample Data | {last_update.replace(' (sample data)', '')}</p>", unsafe_allow_html=True)
-                else:
-                    st.markdown(f"<p style='color: #33ff33;'>Base: USD | Source: API | {last_update}</p>", unsafe_allow_html=True)
-            else:
-                st.markdown("<h3>Current Exchange Rates</h3>", unsafe_allow_html=True)
-
-                # Parse last_update to show appropriate status (standard theme)
-                if "(cached)" in last_update:
-                    st.markdown(f"<p style='color: #6c757d;'>Base: USD | Source: Cache | {last_update.replace(' (cached)', '')}</p>", unsafe_allow_html=True)
-                elif "(offline mode)" in last_update:
-                    st.markdown(f"<p style='color: #fd7e14;'>Base: USD | Source: Cache (OFFLINE) | {last_update.replace(' (offline mode)', '')}</p>", unsafe_allow_html=True)
-                elif "(sample data)" in last_update:
-                    st.markdown(f"<p style='color: #fd7e14;'>Base: USD | Source: Sample Data | {last_update.replace(' (sample data)', '')}</p>", unsafe_allow_html=True)
-                else:
-                    st.markdown(f"<p style='color: #6c757d;'>Base: USD | Source: API | {last_update}</p>", unsafe_allow_html=True)
-
-            # Display exchange rates in a styled table
-            st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
-
-            # Create rates table
-            table_html = create_rates_table(rates, currency_codes)
-            # Important: use st.write to render HTML properly, not st.markdown
-            st.write(table_html, unsafe_allow_html=True)
-            st.markdown("</div>", unsafe_allow_html=True)
-            
-            # System information display
-            if st.session_state.theme == "retro":
-                st.markdown(f"<pre style='color: #33ff33; font-family: VT323, monospace;'>{display_system_info()}</pre>", unsafe_allow_html=True)
-            else:
-                st.markdown(f"<div style='color: #6c757d; font-family: Roboto, sans-serif; background-color: #f8f9fa; padding: 10px; border-radius: 4px; border: 1px solid #dee2e6;'>{display_system_info()}</div>", unsafe_allow_html=True)
-            
-            # Theme-appropriate footer
-            if st.session_state.theme == "retro":
-                st.markdown("""
-                <div class="system-stats">
-                    <p>SYSTEM PERFORMANCE: NOMINAL</p>
-                    <p>EXCHANGE DATA: ONLINE</p>
-                    <p>CONNECTION: SECURE</p>
-                    <p>(C) RETRO SYSTEMS INC. 2025</p>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown("""
-                <div class="system-stats">
-                    <p>System Status: Online</p>
-                    <p>Data Source: Open Exchange Rates API</p>
-                    <p>© 2025 Modern Systems Inc.</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-        except Exception as error:
-            # Handle any unexpected errors in the sidebar
-            st.error(f"Error displaying exchange rates: {str(error)}")
+        _rates_sidebar(currency_codes, force_refresh)
 
 # Run the application
 if __name__ == "__main__":
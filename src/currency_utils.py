@@ -4,12 +4,40 @@ Provides functions for loading, retrieving, and converting currency data.
 """
 import json
 import os
-import requests
-from datetime import datetime, timedelta
+import socket
+import threading
+from zlib import crc32
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import time
 
+import numpy as np
+
+# orjson serializes/parses several times faster than stdlib json, but it
+# is optional: fall back to json so the documented minimal-dependency
+# install keeps working. Both paths speak bytes, so cache files are
+# opened in binary mode.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def _loads(data):
+        return json.loads(data)
+
 # Cache variables to store data and avoid repeated API calls/file reads
 _currencies_cache = None
+_by_code_cache = None
+_codes_cache = None
+_code_set_cache = None
 _exchange_rates_cache = {}
 _historical_rates_cache = {}
 
@@ -20,18 +48,95 @@ _cache_expiry = {
 }
 _last_updated = {}
 
-def get_cache_file_path(cache_type):
+# Parsed mirror of the per-entry cache files, invalidated by mtime: a
+# repeat load costs one stat instead of a read plus JSON parse
+_disk_mirror = {}
+_disk_mtime = {}
+
+# Guards writes to the module caches above; concurrent readers see either
+# the old or the new entry, never a torn pair of data and timestamp
+_cache_lock = threading.Lock()
+
+# Repository paths computed once at import; every cache lookup and the
+# currencies load would otherwise rebuild them join by join per call
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_CURRENCIES_PATH = os.path.join(_ROOT_DIR, 'data', 'currencies.json')
+_CACHE_DIR = os.path.join(_ROOT_DIR, 'data', 'cache')
+
+# Connectivity probe cache: the answer rarely changes second to second,
+# so one cheap TCP dial is shared across calls for the TTL window
+_NET_CHECK_TTL = 10
+_net_cache = {'ok': None, 'ts': 0.0}
+
+def _network_available(force_check=False):
+    """
+    Check network connectivity with a cached TCP probe.
+
+    Dials Google DNS on port 53 — a plain TCP connect, no TLS handshake —
+    and remembers the answer for _NET_CHECK_TTL seconds so back-to-back
+    rate lookups don't each pay a probe.
+
+    Args:
+        force_check (bool): Bypass the cached answer and re-probe now
+
+    Returns:
+        bool: True if the network is reachable
+    """
+    now = time.time()
+    if (not force_check and _net_cache['ok'] is not None
+            and now - _net_cache['ts'] < _NET_CHECK_TTL):
+        return _net_cache['ok']
+
+    try:
+        socket.create_connection(("8.8.8.8", 53), timeout=0.3).close()
+        _net_cache['ok'] = True
+    except OSError:
+        _net_cache['ok'] = False
+    _net_cache['ts'] = now
+    return _net_cache['ok']
+
+# Shared HTTP session: keep-alive connections skip the per-request DNS
+# lookup and TLS handshake, which dominate the historical backfill
+_session = None
+
+def _get_session():
     """
-    Get the file path for a specific cache file type.
+    Get the shared requests.Session, creating it on first use.
+
+    Returns:
+        requests.Session: Session with a pooled HTTPS adapter
+    """
+    global _session
+    if _session is None:
+        # Imported here, not at module top: requests drags in urllib3,
+        # certifi and ssl (~100-200ms), which offline/sample-only callers
+        # never need
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        _session.mount('https://', adapter)
+        _session.mount('http://', adapter)
+    return _session
+
+def get_cache_file_path(cache_type, key):
+    """
+    Get the file path for one cache entry.
+
+    Entries are stored one-per-file under data/cache/{cache_type}/ so a
+    save touches only the entry being written instead of rewriting the
+    whole cache blob.
 
     Args:
         cache_type (str): Type of cache ('exchange_rates', 'historical_rates')
+        key (str): Entry key (e.g. 'USD' or 'USD_30')
 
     Returns:
-        str: Absolute path to the cache file
+        str: Absolute path to the cache entry file
     """
-    # Create cache directory if it doesn't exist
-    cache_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'cache')
+    # Create the per-type cache directory if it doesn't exist
+    cache_dir = os.path.join(_CACHE_DIR, cache_type)
     if not os.path.exists(cache_dir):
         try:
             os.makedirs(cache_dir)
@@ -39,9 +144,9 @@ def get_cache_file_path(cache_type):
             print(f"Warning: Could not create cache directory at {cache_dir}")
             return None
 
-    return os.path.join(cache_dir, f"{cache_type}.json")
+    return os.path.join(cache_dir, f"{key}.json")
 
-def save_to_cache(cache_type, data, base_currency=None):
+def save_to_cache(cache_type, data, base_currency=None, etag=None, last_modified=None):
     """
     Save data to both memory cache and disk cache.
 
@@ -49,55 +154,48 @@ def save_to_cache(cache_type, data, base_currency=None):
         cache_type (str): Type of cache ('exchange_rates', 'historical_rates')
         data (dict): Data to cache
         base_currency (str, optional): Base currency for the rates
+        etag (str, optional): ETag header from the API response, stored so
+            the next refresh can send a conditional request
+        last_modified (str, optional): Last-Modified header, same purpose
 
     Returns:
         bool: True if successful, False otherwise
     """
     try:
-        # Update in-memory cache
+        timestamp = time.time()
+
+        # Update in-memory cache and derive the entry key
         if cache_type == 'exchange_rates':
-            _exchange_rates_cache[base_currency] = data
-            _last_updated[f'exchange_rates_{base_currency}'] = time.time()
+            key = base_currency
+            with _cache_lock:
+                _exchange_rates_cache[base_currency] = data
+                _last_updated[f'exchange_rates_{base_currency}'] = timestamp
         elif cache_type == 'historical_rates':
             key = f"{base_currency}_{len(data)}"  # Key format: "USD_30" for 30 days of USD data
-            _historical_rates_cache[key] = data
-            _last_updated[f'historical_rates_{key}'] = time.time()
+            with _cache_lock:
+                _historical_rates_cache[key] = data
+                _last_updated[f'historical_rates_{key}'] = timestamp
+        else:
+            return False
 
-        # Get cache file path
-        cache_file = get_cache_file_path(cache_type)
+        # Get cache file path for this entry
+        cache_file = get_cache_file_path(cache_type, key)
         if not cache_file:
             return False
 
-        # Load existing cache file if it exists
-        cache_data = {}
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                # If file is corrupted, start with empty cache
-                cache_data = {}
+        # Write only this entry's file — O(entry) instead of rewriting the
+        # whole cache. The temp-file + os.replace swap is atomic, so a
+        # concurrent reader never sees a half-written entry.
+        entry = {'data': data, 'timestamp': timestamp}
+        if etag:
+            entry['etag'] = etag
+        if last_modified:
+            entry['last_modified'] = last_modified
 
-        # Update cache data
-        if cache_type == 'exchange_rates':
-            if 'rates' not in cache_data:
-                cache_data['rates'] = {}
-            cache_data['rates'][base_currency] = {
-                'data': data,
-                'timestamp': time.time()
-            }
-        elif cache_type == 'historical_rates':
-            if 'rates' not in cache_data:
-                cache_data['rates'] = {}
-            key = f"{base_currency}_{len(data)}"
-            cache_data['rates'][key] = {
-                'data': data,
-                'timestamp': time.time()
-            }
-
-        # Write updated cache to file
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2)
+        tmp_file = f"{cache_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(_dumps(entry))
+        os.replace(tmp_file, cache_file)
 
         return True
     except Exception as e:
@@ -117,68 +215,110 @@ def load_from_cache(cache_type, base_currency=None, days=None):
         tuple: (data, is_expired) or (None, True) if not found or error
     """
     try:
-        # Check in-memory cache first
+        # Read the clock once per call; every freshness comparison below
+        # uses the same instant. Wall-clock time.time() is kept (rather
+        # than time.monotonic()) because the timestamps are persisted to
+        # disk and compared across process restarts.
+        now = time.time()
+
+        # Check in-memory cache first; one .get per dict instead of a
+        # membership test followed by a second lookup
         if cache_type == 'exchange_rates':
-            if base_currency in _exchange_rates_cache:
-                # Check if expired
-                cache_key = f'exchange_rates_{base_currency}'
-                last_update = _last_updated.get(cache_key, 0)
-                is_expired = (time.time() - last_update) > _cache_expiry['exchange_rates']
-                return _exchange_rates_cache[base_currency], is_expired
+            cached = _exchange_rates_cache.get(base_currency)
+            if cached is not None:
+                last_update = _last_updated.get(f'exchange_rates_{base_currency}', 0)
+                is_expired = (now - last_update) > _cache_expiry['exchange_rates']
+                return cached, is_expired
 
         elif cache_type == 'historical_rates' and days:
             key = f"{base_currency}_{days}"
-            if key in _historical_rates_cache:
-                cache_key = f'historical_rates_{key}'
-                last_update = _last_updated.get(cache_key, 0)
-                is_expired = (time.time() - last_update) > _cache_expiry['historical_rates']
-                return _historical_rates_cache[key], is_expired
-
-        # If not in memory cache, try disk cache
-        cache_file = get_cache_file_path(cache_type)
-        if not cache_file or not os.path.exists(cache_file):
+            cached = _historical_rates_cache.get(key)
+            if cached is not None:
+                last_update = _last_updated.get(f'historical_rates_{key}', 0)
+                is_expired = (now - last_update) > _cache_expiry['historical_rates']
+                return cached, is_expired
+
+        # If not in memory cache, try this entry's disk file
+        if cache_type == 'exchange_rates':
+            key = base_currency
+        elif cache_type == 'historical_rates' and days:
+            key = f"{base_currency}_{days}"
+        else:
             return None, True
 
-        with open(cache_file, 'r', encoding='utf-8') as f:
-            cache_data = json.load(f)
+        cache_file = get_cache_file_path(cache_type, key)
+        if not cache_file:
+            return None, True
 
-        if 'rates' not in cache_data:
+        # stat doubles as the existence check; reparse only when the file
+        # has actually changed since the mirrored copy was taken
+        try:
+            mtime = os.path.getmtime(cache_file)
+        except OSError:
             return None, True
 
-        if cache_type == 'exchange_rates':
-            if base_currency in cache_data['rates']:
-                data = cache_data['rates'][base_currency]
-                timestamp = data.get('timestamp', 0)
-                is_expired = (time.time() - timestamp) > _cache_expiry['exchange_rates']
-
-                # Update memory cache
-                if not is_expired:
-                    _exchange_rates_cache[base_currency] = data['data']
-                    _last_updated[f'exchange_rates_{base_currency}'] = timestamp
+        if _disk_mtime.get(cache_file) != mtime:
+            with open(cache_file, 'rb') as f:
+                parsed = _loads(f.read())
+            with _cache_lock:
+                _disk_mirror[cache_file] = parsed
+                _disk_mtime[cache_file] = mtime
+        entry = _disk_mirror[cache_file]
 
-                return data['data'], is_expired
+        data = entry.get('data')
+        if data is None:
+            return None, True
 
-        elif cache_type == 'historical_rates' and days:
-            key = f"{base_currency}_{days}"
-            if key in cache_data['rates']:
-                data = cache_data['rates'][key]
-                timestamp = data.get('timestamp', 0)
-                is_expired = (time.time() - timestamp) > _cache_expiry['historical_rates']
-
-                # Update memory cache
-                if not is_expired:
-                    _historical_rates_cache[key] = data['data']
-                    _last_updated[f'historical_rates_{key}'] = timestamp
+        timestamp = entry.get('timestamp', 0)
+        is_expired = (now - timestamp) > _cache_expiry[cache_type]
 
-                return data['data'], is_expired
+        # Update memory cache
+        if not is_expired:
+            if cache_type == 'exchange_rates':
+                with _cache_lock:
+                    _exchange_rates_cache[base_currency] = data
+                    _last_updated[f'exchange_rates_{base_currency}'] = timestamp
+            else:
+                with _cache_lock:
+                    _historical_rates_cache[key] = data
+                    _last_updated[f'historical_rates_{key}'] = timestamp
 
-        # Not found in cache
-        return None, True
+        return data, is_expired
 
     except Exception as e:
         print(f"Warning: Failed to load from cache: {str(e)}")
         return None, True
 
+def _cached_validators(cache_type, key):
+    """
+    Get the stored HTTP validators for a cache entry, if any.
+
+    Args:
+        cache_type (str): Type of cache ('exchange_rates', 'historical_rates')
+        key (str): Entry key (e.g. 'USD')
+
+    Returns:
+        tuple: (etag, last_modified), either element may be None
+    """
+    try:
+        cache_file = get_cache_file_path(cache_type, key)
+        if not cache_file:
+            return None, None
+        mtime = os.path.getmtime(cache_file)
+        if _disk_mtime.get(cache_file) != mtime:
+            with open(cache_file, 'rb') as f:
+                parsed = _loads(f.read())
+            # Same locking discipline as load_from_cache: update the
+            # mirror and its mtime as one unit so readers never see a
+            # torn pair
+            with _cache_lock:
+                _disk_mirror[cache_file] = parsed
+                _disk_mtime[cache_file] = mtime
+        entry = _disk_mirror[cache_file]
+        return entry.get('etag'), entry.get('last_modified')
+    except (OSError, ValueError):
+        return None, None
+
 def load_currencies():
     """
     Load currency data from the JSON file.
@@ -188,27 +328,30 @@ def load_currencies():
     Returns:
         list: List of currency dictionaries, each containing 'code', 'name', and 'symbol'
     """
-    global _currencies_cache
+    global _currencies_cache, _by_code_cache, _codes_cache, _code_set_cache
 
     # Return cached currencies if available
     if _currencies_cache is not None:
         return _currencies_cache
 
-    # Construct file path dynamically for cross-platform compatibility
-    currencies_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'currencies.json')
-
     try:
-        with open(currencies_path, 'r', encoding='utf-8') as file:
-            # Load and cache the currencies data
-            _currencies_cache = json.load(file)['currencies']
+        with open(_CURRENCIES_PATH, 'rb') as file:
+            # Load and cache the currencies data, plus a code-keyed index
+            # so the accessors below resolve in one dict probe instead of
+            # scanning the list per call
+            _currencies_cache = _loads(file.read())['currencies']
+            _by_code_cache = {currency['code']: currency for currency in _currencies_cache}
+            _codes_cache = list(_by_code_cache)
+            _code_set_cache = frozenset(_codes_cache)
             return _currencies_cache
     except FileNotFoundError:
         # Return an empty list if file not found to prevent application crash
-        print(f"Warning: Currency data file not found at {currencies_path}")
+        print(f"Warning: Currency data file not found at {_CURRENCIES_PATH}")
         return []
-    except json.JSONDecodeError:
-        # Return an empty list if JSON is invalid to prevent application crash
-        print(f"Warning: Invalid JSON in currency data file at {currencies_path}")
+    except ValueError:
+        # Return an empty list if JSON is invalid to prevent application
+        # crash (covers both json and orjson decode errors)
+        print(f"Warning: Invalid JSON in currency data file at {_CURRENCIES_PATH}")
         return []
 
 def get_currency_codes():
@@ -218,45 +361,114 @@ def get_currency_codes():
     Returns:
         list: List of currency codes (e.g., 'USD', 'EUR', etc.)
     """
-    currencies = load_currencies()
-    return [currency['code'] for currency in currencies]
+    load_currencies()
+    return list(_codes_cache) if _codes_cache else []
+
+def is_valid_code(code):
+    """
+    Check whether a currency code is one we know about.
+
+    Membership test against a frozenset built once alongside the
+    code-keyed index, so validation is O(1) with no scanning.
+
+    Args:
+        code (str): The currency code to check (e.g., 'USD')
+
+    Returns:
+        bool: True if the code is a known currency, False otherwise
+    """
+    load_currencies()
+    return code in _code_set_cache if _code_set_cache else False
 
 def get_currency_name(code):
     """
     Get the full name of a currency based on its code.
-    
+
+    Resolved through the code-keyed index built by load_currencies, so
+    each lookup is a single dict probe.
+
     Args:
         code (str): The currency code (e.g., 'USD')
-        
+
     Returns:
         str or None: The currency name or None if code not found
     """
-    currencies = load_currencies()
-    for currency in currencies:
-        if currency['code'] == code:
-            return currency['name']
-    return None
+    load_currencies()
+    currency = _by_code_cache.get(code) if _by_code_cache else None
+    return currency['name'] if currency else None
 
 def get_currency_symbol(code):
     """
     Get the symbol of a currency based on its code.
-    
+
+    Resolved through the same code-keyed index as get_currency_name.
+
     Args:
         code (str): The currency code (e.g., 'USD')
-        
+
     Returns:
         str or None: The currency symbol or None if code not found
     """
-    currencies = load_currencies()
-    for currency in currencies:
-        if currency['code'] == code:
-            return currency['symbol']
-    return None
+    load_currencies()
+    currency = _by_code_cache.get(code) if _by_code_cache else None
+    return currency['symbol'] if currency else None
+
+@lru_cache(maxsize=256)
+def _fmt_rfc1123(ts_int):
+    """
+    Format a Unix timestamp in the API's RFC-1123-style layout, memoized.
+
+    strftime with locale-aware %a/%b is comparatively expensive and
+    get_exchange_rates can format the same timestamp on every cache hit,
+    so identical seconds collapse to a dict lookup.
+
+    Args:
+        ts_int (int): Unix timestamp truncated to the second
+
+    Returns:
+        str: Formatted time string, e.g. 'Mon, 01 Sep 2025 12:00:00 +0000'
+    """
+    return datetime.fromtimestamp(ts_int).strftime("%a, %d %b %Y %H:%M:%S +0000")
 
 def get_exchange_rates(base_currency="USD", force_refresh=False):
     """
     Get current exchange rates for a given base currency.
 
+    Calls within the same wall-clock minute collapse to an lru_cache hit
+    (rates never move faster than that), bypassing even the cache-layer
+    bookkeeping below. A forced refresh drops the memo and goes straight
+    to the full path.
+
+    Args:
+        base_currency (str): The base currency code (default: 'USD')
+        force_refresh (bool): Force refresh from API even if cache is valid
+
+    Returns:
+        tuple: (exchange_rates_dict, last_update_time_string)
+    """
+    if force_refresh:
+        _rates_by_minute.cache_clear()
+        return _get_exchange_rates_impl(base_currency, True)
+    return _rates_by_minute(base_currency, int(time.time() // 60))
+
+@lru_cache(maxsize=32)
+def _rates_by_minute(base_currency, minute):
+    """
+    Minute-granular memo over the full rates lookup.
+
+    Args:
+        base_currency (str): The base currency code
+        minute (int): Current Unix time divided by 60, the memo key
+
+    Returns:
+        tuple: (exchange_rates_dict, last_update_time_string)
+    """
+    return _get_exchange_rates_impl(base_currency, False)
+
+def _get_exchange_rates_impl(base_currency, force_refresh):
+    """
+    Full rates lookup behind get_exchange_rates.
+
     Uses three layers of data sources with fallbacks:
     1. Memory cache (fastest)
     2. Disk cache (fast, persists between app restarts)
@@ -264,7 +476,7 @@ def get_exchange_rates(base_currency="USD", force_refresh=False):
     4. Sample data (fallback when all else fails)
 
     Args:
-        base_currency (str): The base currency code (default: 'USD')
+        base_currency (str): The base currency code
         force_refresh (bool): Force refresh from API even if cache is valid
 
     Returns:
@@ -279,18 +491,14 @@ def get_exchange_rates(base_currency="USD", force_refresh=False):
             # Get formatted time string for the cached data
             cache_key = f'exchange_rates_{base_currency}'
             last_update_time = _last_updated.get(cache_key, time.time())
-            last_update_str = datetime.fromtimestamp(last_update_time).strftime("%a, %d %b %Y %H:%M:%S +0000")
+            last_update_str = _fmt_rfc1123(int(last_update_time))
 
             return cached_rates, f"{last_update_str} (cached)"
 
     # If we need to refresh (expired cache or forced refresh), try the API
     try:
-        # Check network connectivity first (quick check to Google DNS)
-        try:
-            requests.get("https://8.8.8.8", timeout=1)
-            network_available = True
-        except requests.RequestException:
-            network_available = False
+        # Check network connectivity first (cached TCP probe to Google DNS)
+        network_available = _network_available()
 
         if not network_available:
             print("Warning: No network connectivity, using offline data")
@@ -300,26 +508,49 @@ def get_exchange_rates(base_currency="USD", force_refresh=False):
                 # Get formatted time string for the cached data
                 cache_key = f'exchange_rates_{base_currency}'
                 last_update_time = _last_updated.get(cache_key, time.time())
-                last_update_str = datetime.fromtimestamp(last_update_time).strftime("%a, %d %b %Y %H:%M:%S +0000")
+                last_update_str = _fmt_rfc1123(int(last_update_time))
 
                 return cached_rates, f"{last_update_str} (offline mode)"
             else:
-                return get_sample_exchange_rates(base_currency), datetime.now().strftime("%a, %d %b %Y %H:%M:%S +0000") + " (sample data)"
-
-        # If network is available, try to fetch fresh data
-        response = requests.get(
+                return get_sample_exchange_rates(base_currency), _fmt_rfc1123(int(time.time())) + " (sample data)"
+
+        # If network is available, try to fetch fresh data. Send the
+        # stored validators so an unchanged upstream body comes back as a
+        # bodyless 304 instead of ~4KB of JSON to re-download and parse.
+        headers = {}
+        etag, last_modified = _cached_validators('exchange_rates', base_currency)
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        response = _get_session().get(
             f"https://open.er-api.com/v6/latest/{base_currency}",
-            timeout=5  # 5 second timeout
+            timeout=5,  # 5 second timeout
+            headers=headers
         )
 
+        if response.status_code == 304:
+            # Not modified: re-save the cached rates to refresh their
+            # timestamp and keep serving them
+            cached_rates, _ = load_from_cache('exchange_rates', base_currency)
+            if cached_rates:
+                save_to_cache('exchange_rates', cached_rates, base_currency,
+                              etag=etag, last_modified=last_modified)
+                return cached_rates, _fmt_rfc1123(int(time.time()))
+
         # Raise an exception for 4XX and 5XX responses
         response.raise_for_status()
 
-        data = response.json()
+        # Parse the body through the same orjson-backed _loads used for
+        # cache files (response.json() always goes through stdlib json)
+        data = _loads(response.content)
 
         if data.get('result') == 'success':
-            # Cache the fresh data
-            save_to_cache('exchange_rates', data['rates'], base_currency)
+            # Cache the fresh data together with its validators
+            save_to_cache('exchange_rates', data['rates'], base_currency,
+                          etag=response.headers.get('ETag'),
+                          last_modified=response.headers.get('Last-Modified'))
             return data['rates'], data['time_last_update_utc']
         else:
             # API returned failure, try cached data even if expired
@@ -327,14 +558,14 @@ def get_exchange_rates(base_currency="USD", force_refresh=False):
             if cached_rates:
                 cache_key = f'exchange_rates_{base_currency}'
                 last_update_time = _last_updated.get(cache_key, time.time())
-                last_update_str = datetime.fromtimestamp(last_update_time).strftime("%a, %d %b %Y %H:%M:%S +0000")
+                last_update_str = _fmt_rfc1123(int(last_update_time))
 
                 return cached_rates, f"{last_update_str} (offline mode)"
             else:
                 # Fall back to sample data
-                return get_sample_exchange_rates(base_currency), datetime.now().strftime("%a, %d %b %Y %H:%M:%S +0000") + " (sample data)"
+                return get_sample_exchange_rates(base_currency), _fmt_rfc1123(int(time.time())) + " (sample data)"
 
-    except (requests.RequestException, json.JSONDecodeError, KeyError) as error:
+    except (OSError, ValueError, KeyError) as error:
         # Log the error
         print(f"Error fetching exchange rates: {str(error)}")
 
@@ -343,58 +574,91 @@ def get_exchange_rates(base_currency="USD", force_refresh=False):
         if cached_rates:
             cache_key = f'exchange_rates_{base_currency}'
             last_update_time = _last_updated.get(cache_key, time.time())
-            last_update_str = datetime.fromtimestamp(last_update_time).strftime("%a, %d %b %Y %H:%M:%S +0000")
+            last_update_str = _fmt_rfc1123(int(last_update_time))
 
             return cached_rates, f"{last_update_str} (offline mode)"
         else:
             # Fall back to sample data
-            return get_sample_exchange_rates(base_currency), datetime.now().strftime("%a, %d %b %Y %H:%M:%S +0000") + " (sample data)"
+            return get_sample_exchange_rates(base_currency), _fmt_rfc1123(int(time.time())) + " (sample data)"
+
+# Sample exchange rates (as of May 2025), stored as parallel arrays so a
+# base change is one vectorized divide instead of a Python loop
+_SAMPLE_CODES = ("USD", "EUR", "GBP", "JPY", "CAD", "AUD",
+                 "CHF", "CNY", "INR", "BRL", "MXN", "SGD")
+_SAMPLE_RATES = np.array([1.0, 0.93, 0.79, 154.56, 1.36, 1.51,
+                          0.91, 7.23, 83.34, 5.04, 16.62, 1.34],
+                         dtype=np.float64)
+
+@lru_cache(maxsize=16)
+def _converted_sample_rates(base_currency):
+    """
+    Sample rates rebased to the given currency, memoized per base.
+
+    Args:
+        base_currency (str): The base currency code (must be a sample code)
+
+    Returns:
+        dict: Currency codes mapped to rates relative to the base
+    """
+    base_value = _SAMPLE_RATES[_SAMPLE_CODES.index(base_currency)]
+    return dict(zip(_SAMPLE_CODES, (_SAMPLE_RATES / base_value).tolist()))
+
+# Background refresher state; guarded so only one thread ever starts
+_REFRESH_INTERVAL = 3600
+_refresher_started = False
+
+def start_background_refresh(interval=_REFRESH_INTERVAL):
+    """
+    Keep the USD rates snapshot warm with a daemon refresher thread.
+
+    The thread sleeps for the interval, then re-fetches USD rates and
+    drops the minute memo, so interactive calls always hit warm caches
+    instead of ever paying the API round trip themselves. Offline
+    periods are harmless: the fetch falls back through the usual cache/
+    sample layers. Idempotent — repeat calls are no-ops.
+
+    Args:
+        interval (int): Seconds between refreshes (default: one hour)
+    """
+    global _refresher_started
+    with _cache_lock:
+        if _refresher_started:
+            return
+        _refresher_started = True
+
+    def _refresh_loop():
+        while True:
+            time.sleep(interval)
+            try:
+                _get_exchange_rates_impl("USD", True)
+                _rates_by_minute.cache_clear()
+            except Exception as error:
+                print(f"Warning: Background rates refresh failed: {str(error)}")
+
+    threading.Thread(target=_refresh_loop, daemon=True,
+                     name="rates-refresher").start()
 
 def get_sample_exchange_rates(base_currency="USD"):
     """
     Get sample exchange rates as a fallback when API is unavailable.
-    
-    Calculates rates for any base currency by normalizing against USD.
-    
+
+    Calculates rates for any base currency by normalizing against USD;
+    the rebased table is computed with one NumPy divide and memoized, so
+    repeated fallbacks with the same base are a dict copy.
+
     Args:
         base_currency (str): The base currency code (default: 'USD')
-        
+
     Returns:
         dict: Exchange rates dictionary with currency codes as keys and rates as values
     """
-    # Sample exchange rates (as of May 2025)
-    base_rates = {
-        "USD": 1.0,
-        "EUR": 0.93,
-        "GBP": 0.79,
-        "JPY": 154.56,
-        "CAD": 1.36,
-        "AUD": 1.51,
-        "CHF": 0.91,
-        "CNY": 7.23,
-        "INR": 83.34,
-        "BRL": 5.04,
-        "MXN": 16.62,
-        "SGD": 1.34
-    }
-    
-    # If base currency is not USD, recalculate all rates
-    if base_currency != "USD":
-        # Make sure the base currency exists in our sample data
-        if base_currency not in base_rates:
-            print(f"Warning: Unknown base currency '{base_currency}', defaulting to USD")
-            return base_rates
-            
-        base_value = base_rates[base_currency]
-        converted_rates = {}
-        
-        # Calculate each rate relative to the new base currency
-        for currency, rate in base_rates.items():
-            converted_rates[currency] = rate / base_value
-            
-        return converted_rates
-    
-    return base_rates
+    # Make sure the base currency exists in our sample data
+    if base_currency not in _SAMPLE_CODES:
+        print(f"Warning: Unknown base currency '{base_currency}', defaulting to USD")
+        base_currency = "USD"
+
+    # Copy so callers can mutate their view without touching the memo
+    return dict(_converted_sample_rates(base_currency))
 
 def get_historical_rates(base_currency="USD", days=30, force_refresh=False):
     """
@@ -419,12 +683,8 @@ def get_historical_rates(base_currency="USD", days=30, force_refresh=False):
         if cached_data and not is_expired:
             return cached_data
 
-    # Check if we have network connectivity
-    try:
-        requests.get("https://8.8.8.8", timeout=1)
-        network_available = True
-    except requests.RequestException:
-        network_available = False
+    # Check if we have network connectivity (cached TCP probe)
+    network_available = _network_available()
 
     # If no network or cache is expired but available, use cache anyway
     if not network_available:
@@ -433,38 +693,38 @@ def get_historical_rates(base_currency="USD", days=30, force_refresh=False):
             return cached_data
 
     historical_data = {}
-    today = datetime.now()
+    today = date.today()
     api_success = False
 
+    # Format every wanted date exactly once; isoformat() produces the same
+    # 'YYYY-MM-DD' keys as the old strftime but in pure C with no
+    # format-string parsing, and the fetch loop and both backfill passes
+    # reuse this list
+    wanted_dates = [(today - timedelta(days=i)).isoformat() for i in range(days)]
+
     # Try to fetch real historical data from API if network is available
     if network_available:
         try:
             # For demonstration, we'll use Open Exchange Rates API
             # In a production app, you would use a paid API with better historical data support
-            for i in range(days):
-                date = (today - timedelta(days=i)).strftime('%Y-%m-%d')
-
-                # Use a simple rate limiting to avoid API throttling
-                if i > 0 and i % 5 == 0:
-                    time.sleep(1)
-
-                # Call the API for the specific date
-                response = requests.get(
-                    f"https://open.er-api.com/v6/historical/{date}?base={base_currency}",
-                    timeout=5
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('result') == 'success':
-                        historical_data[date] = data['rates']
-                        api_success = True
-                    else:
-                        # Use sample data for this date if API call fails
-                        historical_data[date] = get_sample_historical_rate(base_currency, i)
+            session = _get_session()
+
+            # The per-date requests are independent and I/O-bound, so they
+            # run concurrently over the pooled session: wall time drops
+            # from ~days x RTT to ~(days / workers) x RTT, and keep-alive
+            # replaces the old blanket time.sleep throttling
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = executor.map(
+                    lambda date: _fetch_historical_day(session, date, base_currency),
+                    wanted_dates)
+
+            for i, (day, rates) in enumerate(zip(wanted_dates, results)):
+                if rates is not None:
+                    historical_data[day] = rates
+                    api_success = True
                 else:
-                    # Use sample data for this date if API call fails
-                    historical_data[date] = get_sample_historical_rate(base_currency, i)
+                    # Use sample data for this date if the API call failed
+                    historical_data[day] = get_sample_historical_rate(base_currency, i)
 
         except Exception as error:
             print(f"Error fetching historical exchange rates: {str(error)}")
@@ -474,19 +734,18 @@ def get_historical_rates(base_currency="USD", days=30, force_refresh=False):
     if not api_success or len(historical_data) < days:
         cached_data, _ = load_from_cache('historical_rates', base_currency, days)
 
-        # If we have cached data, use it to fill in any missing dates
+        # Fill gaps from cache with set arithmetic: only dates that are
+        # wanted, missing, and cached are touched
         if cached_data:
-            # For any missing dates, use cached data
-            for date in cached_data:
-                if date not in historical_data:
-                    historical_data[date] = cached_data[date]
+            missing = set(wanted_dates) - historical_data.keys()
+            for day in missing & cached_data.keys():
+                historical_data[day] = cached_data[day]
 
         # If we still don't have enough data, generate sample data
         if len(historical_data) < days:
-            for i in range(days):
-                date = (today - timedelta(days=i)).strftime('%Y-%m-%d')
-                if date not in historical_data:
-                    historical_data[date] = get_sample_historical_rate(base_currency, i)
+            for i, day in enumerate(wanted_dates):
+                if day not in historical_data:
+                    historical_data[day] = get_sample_historical_rate(base_currency, i)
 
     # Cache the results if we have full data
     if len(historical_data) == days:
@@ -494,6 +753,31 @@ def get_historical_rates(base_currency="USD", days=30, force_refresh=False):
 
     return historical_data
 
+def _fetch_historical_day(session, date, base_currency):
+    """
+    Fetch one day's rates from the historical API.
+
+    Args:
+        session (requests.Session): Shared session with pooled connections
+        date (str): Date in 'YYYY-MM-DD' format
+        base_currency (str): The base currency code
+
+    Returns:
+        dict or None: Rates for that date, or None if the call failed
+    """
+    try:
+        response = session.get(
+            f"https://open.er-api.com/v6/historical/{date}?base={base_currency}",
+            timeout=5
+        )
+        if response.status_code == 200:
+            data = _loads(response.content)
+            if data.get('result') == 'success':
+                return data['rates']
+    except (OSError, ValueError):
+        pass
+    return None
+
 def get_sample_historical_rate(base_currency="USD", days_ago=0):
     """
     Generate sample historical exchange rates for demo purposes.
@@ -507,24 +791,98 @@ def get_sample_historical_rate(base_currency="USD", days_ago=0):
     Returns:
         dict: Dictionary of sample historical rates
     """
-    import random
-
     # Get the base sample rates
     base_rates = get_sample_exchange_rates(base_currency)
-    historical_rates = {}
+    codes = tuple(base_rates)
+
+    # One vectorized multiply applies every variation at once; the draws
+    # themselves are memoized per (codes, days_ago)
+    rates = np.fromiter(base_rates.values(), dtype=np.float64, count=len(codes))
+    varied = rates * (1.0 + _sample_variations(codes, days_ago))
+
+    return dict(zip(codes, varied.tolist()))
+
+@lru_cache(maxsize=128)
+def _sample_variations(codes, days_ago):
+    """
+    Deterministic per-day rate variations, drawn once per (codes, day).
+
+    Seeds come from crc32 of the old "{currency}_{days_ago}" seed strings
+    (stable across processes, unlike hash()), feeding a single NumPy
+    generator so all ~12 draws happen in one vectorized uniform call
+    instead of a reseed-and-draw loop per currency.
+
+    Args:
+        codes (tuple): Currency codes in table order
+        days_ago (int): Number of days in the past
+
+    Returns:
+        numpy.ndarray: Variation factors between -3% and +3%
+    """
+    seeds = [crc32(f"{currency}_{days_ago}".encode()) for currency in codes]
+    rng = np.random.default_rng(seeds)
+    return rng.uniform(-0.03, 0.03, size=len(codes))
+
+
+def convert_currency_batch(amounts, from_currency, to_currency):
+    """
+    Convert many amounts between the same currency pair at once.
 
-    # Add small random variations to each rate
-    for currency, rate in base_rates.items():
-        # Create a consistent but varying rate using the seed of days_ago
-        random.seed(f"{currency}_{days_ago}")
+    Performs one rate lookup and a single vectorized multiply instead of
+    a Python-level convert_currency call per amount, so large batches run
+    at C speed.
 
-        # Variation factor: between -3% and +3%
-        variation = random.uniform(-0.03, 0.03)
+    Args:
+        amounts (array-like): Amounts to convert
+        from_currency (str): The source currency code
+        to_currency (str): The target currency code
+
+    Returns:
+        numpy.ndarray or None: Converted amounts, or None if the rate
+            could not be resolved
+    """
+    values = np.abs(np.asarray(amounts, dtype=np.float64))
 
-        # Calculate the historical rate with variation
-        historical_rates[currency] = rate * (1 + variation)
+    # Same currency, no conversion needed
+    if from_currency == to_currency:
+        return values
 
-    return historical_rates
+    try:
+        rate = _cross_rate(from_currency, to_currency)
+        if rate is None:
+            print(f"Warning: Could not resolve rate for '{from_currency}'->'{to_currency}'")
+            return None
+        return values * rate
+    except Exception as error:
+        print(f"Error during batch currency conversion: {str(error)}")
+        return None
+
+def _cross_rate(from_currency, to_currency):
+    """
+    Resolve a conversion rate from the single USD-based table.
+
+    Exchange rates form a triangle: rate(A->B) = usd[B] / usd[A], so one
+    cached USD fetch serves every currency pair instead of a separate
+    base-specific fetch per source currency. Falls back to a
+    from_currency-based fetch if either code is missing from the USD
+    table.
+
+    Args:
+        from_currency (str): The source currency code
+        to_currency (str): The target currency code
+
+    Returns:
+        float or None: The conversion rate, or None if unresolvable
+    """
+    usd_rates, _ = get_exchange_rates("USD")
+    from_rate = usd_rates.get(from_currency)
+    to_rate = usd_rates.get(to_currency)
+    if from_rate and to_rate:
+        return to_rate / from_rate
+
+    # Fall back to fetching with the source currency as base
+    rates, _ = get_exchange_rates(from_currency)
+    return rates.get(to_currency)
 
 def convert_currency(amount, from_currency, to_currency):
     """
@@ -549,12 +907,11 @@ def convert_currency(amount, from_currency, to_currency):
         amount = abs(amount)
 
     try:
-        # Get exchange rates with the from_currency as base
-        rates, _ = get_exchange_rates(from_currency)
-
-        # Check if target currency is in the rates
-        if to_currency in rates:
-            return amount * rates[to_currency]
+        # Derive the rate from the shared USD table (one fetch serves all
+        # currency pairs)
+        rate = _cross_rate(from_currency, to_currency)
+        if rate is not None:
+            return amount * rate
         else:
             print(f"Warning: Target currency '{to_currency}' not found in exchange rates")
             return None
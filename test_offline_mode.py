@@ -23,9 +23,9 @@ class TestOfflineMode(unittest.TestCase):
             os.makedirs(cache_dir)
     
     def test_cache_file_path(self):
-        """Test that cache file paths are correctly generated."""
-        path = get_cache_file_path('exchange_rates')
-        expected_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'cache', 'exchange_rates.json')
+        """Test that per-entry cache file paths are correctly generated."""
+        path = get_cache_file_path('exchange_rates', 'USD')
+        expected_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'cache', 'exchange_rates', 'USD.json')
         self.assertEqual(path, expected_path)
     
     def test_save_and_load_cache(self):
@@ -82,19 +82,15 @@ class TestOfflineMode(unittest.TestCase):
 
     def test_cache_expiry(self):
         """Test that cache expiry works correctly."""
-        # Create a very simple cache file with old timestamp
-        cache_file = get_cache_file_path('exchange_rates')
-        test_data = {
-            "rates": {
-                "USD": {
-                    "data": {"USD": 1.0, "EUR": 0.85},
-                    "timestamp": time.time() - 7200  # 2 hours ago (beyond the 1 hour expiry)
-                }
-            }
+        # Create a per-entry cache file with an old timestamp
+        cache_file = get_cache_file_path('exchange_rates', 'USD')
+        test_entry = {
+            "data": {"USD": 1.0, "EUR": 0.85},
+            "timestamp": time.time() - 7200  # 2 hours ago (beyond the 1 hour expiry)
         }
         
         with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(test_data, f)
+            json.dump(test_entry, f)
         
         # Load the cache - should be expired
         cached_data, is_expired = load_from_cache('exchange_rates', "USD")